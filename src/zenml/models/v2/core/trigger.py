@@ -220,6 +220,43 @@ class TriggerResponse(
         max_length=STR_FIELD_MAX_LENGTH,
     )
 
+    @classmethod
+    def from_db(
+        cls,
+        body: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+        resources: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "TriggerResponse":
+        """Build a trigger response from trusted database values.
+
+        The values passed to this method were already validated when they
+        were written to the database, so the response and its nested models
+        are built without running the Pydantic validation again. Models
+        received from external sources (e.g. the REST API) should still be
+        created through the regular constructor or `model_validate`.
+
+        Args:
+            body: The values of the response body.
+            metadata: The values of the response metadata, if included.
+            resources: The values of the response resources, if included.
+            **kwargs: The top-level fields of the response (e.g. `id` and
+                `name`).
+
+        Returns:
+            The trigger response.
+        """
+        return cls.model_construct(
+            body=TriggerResponseBody.model_construct(**body),
+            metadata=TriggerResponseMetadata.model_construct(**metadata)
+            if metadata is not None
+            else None,
+            resources=TriggerResponseResources.model_construct(**resources)
+            if resources is not None
+            else None,
+            **kwargs,
+        )
+
     def get_hydrated_version(self) -> "TriggerResponse":
         """Get the hydrated version of this trigger.
 
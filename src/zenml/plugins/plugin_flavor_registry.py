@@ -14,9 +14,21 @@
 """Registry for all plugins."""
 
 import math
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Type
-
-from pydantic import BaseModel, ConfigDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from zenml.enums import PluginSubType, PluginType
 from zenml.integrations.registry import integration_registry
@@ -38,64 +50,107 @@ class RegistryEntry(BaseModel):
     plugin_instance: Optional[BasePlugin] = None
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+    _initialization_error: Optional[Exception] = PrivateAttr(None)
+
+    def get_plugin_instance(self) -> BasePlugin:
+        """Get the plugin instance, creating it on first access.
+
+        A plugin whose constructor failed is not created again, the original
+        failure is reported for every later access instead.
+
+        Returns:
+            The plugin instance of this entry.
+
+        Raises:
+            RuntimeError: If the plugin failed to initialize.
+        """
+        if self.plugin_instance is None:
+            with self._lock:
+                if (
+                    self.plugin_instance is None
+                    and self._initialization_error is None
+                ):
+                    try:
+                        self.plugin_instance = (
+                            self.flavor_class.PLUGIN_CLASS()
+                        )
+                    except Exception as e:
+                        self._initialization_error = e
+
+        if self.plugin_instance is None:
+            raise RuntimeError(
+                f"Plugin for flavor {self.flavor_class.FLAVOR} of type "
+                f"{self.flavor_class.TYPE} and subtype "
+                f"{self.flavor_class.SUBTYPE} was not initialized: "
+                f"{self._initialization_error}"
+            ) from self._initialization_error
+        return self.plugin_instance
+
 
 class PluginFlavorRegistry:
     """Registry for plugin flavors."""
 
     def __init__(self) -> None:
         """Initialize the event flavor registry."""
-        self.plugin_flavors: Dict[
-            PluginType, Dict[PluginSubType, Dict[str, RegistryEntry]]
+        self._entries: Dict[
+            Tuple[PluginType, PluginSubType, str], RegistryEntry
+        ] = {}
+        # Secondary indices for listing types, subtypes and flavors in
+        # registration order. They are appended to while registering and
+        # exposed through tuple snapshots, which are built on the first read
+        # after a registration and then returned as-is.
+        self._types_list: List[PluginType] = []
+        self._by_type: Dict[PluginType, List[PluginSubType]] = {}
+        self._by_type_subtype: Dict[
+            Tuple[PluginType, PluginSubType], List[Type[BasePluginFlavor]]
         ] = {}
+        self._snapshots: Dict[Any, Tuple[Any, ...]] = {}
         self.register_plugin_flavors()
 
+    def _snapshot(self, key: Any, items: List[Any]) -> Tuple[Any, ...]:
+        """Get an immutable snapshot of one of the registry indices.
+
+        Args:
+            key: Key identifying the index.
+            items: The current items of the index.
+
+        Returns:
+            The items as a tuple, shared between reads until the next
+            registration.
+        """
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = self._snapshots[key] = tuple(items)
+        return snapshot
+
     @property
-    def _types(self) -> List[PluginType]:
+    def _types(self) -> Tuple[PluginType, ...]:
         """Returns all available types.
 
         Returns:
-            List of all available plugin types.
+            Tuple of all available plugin types.
         """
-        return list(self.plugin_flavors.keys())
+        return self._snapshot("types", self._types_list)
 
     def list_subtypes_within_type(
         self, _type: PluginType
-    ) -> List[PluginSubType]:
+    ) -> Tuple[PluginSubType, ...]:
         """Returns all available subtypes for a given type.
 
         Args:
             _type: The type of plugin
 
         Returns:
-            A list of available plugin subtypes for this plugin type.
+            A tuple of available plugin subtypes for this plugin type.
         """
-        return list(self.plugin_flavors[_type].keys())
-
-    def _flavor_entries(
-        self, _type: PluginType, subtype: PluginSubType
-    ) -> Dict[str, RegistryEntry]:
-        """Get a list of all subtypes for a specific flavor and type.
-
-        Args:
-            _type: The type of Plugin
-            subtype: The subtype of the plugin
-
-        Returns:
-            Dict of Registry entries sorted by flavor name.
-        """
-        if (
-            _type in self.plugin_flavors
-            and subtype in self.plugin_flavors[_type]
-        ):
-            return self.plugin_flavors[_type][subtype]
-        else:
-            return {}
+        return self._snapshot(("subtypes", _type), self._by_type[_type])
 
     def list_available_flavors_for_type_and_subtype(
         self,
         _type: PluginType,
         subtype: PluginSubType,
-    ) -> List[Type[BasePluginFlavor]]:
+    ) -> Tuple[Type[BasePluginFlavor], ...]:
         """Get a list of all subtypes for a specific flavor and type.
 
         Args:
@@ -103,17 +158,12 @@ class PluginFlavorRegistry:
             subtype: The subtype of the plugin
 
         Returns:
-            List of flavors for the given type/subtype combination.
+            Tuple of flavors for the given type/subtype combination.
         """
-        flavors = list(
-            [
-                entry.flavor_class
-                for _, entry in self._flavor_entries(
-                    _type=_type, subtype=subtype
-                ).items()
-            ]
+        return self._snapshot(
+            ("flavors", _type, subtype),
+            self._by_type_subtype.get((_type, subtype), []),
         )
-        return flavors
 
     def list_available_flavor_responses_for_type_and_subtype(
         self,
@@ -136,8 +186,15 @@ class PluginFlavorRegistry:
             A page of flavors.
 
         Raises:
-            ValueError: If the page is out of range.
+            ValueError: If the page size is not positive or the page is out
+                of range.
         """
+        if size <= 0:
+            raise ValueError(
+                f"Invalid page size {size}. The page size must be a positive "
+                "integer."
+            )
+
         flavors = self.list_available_flavors_for_type_and_subtype(
             _type=_type,
             subtype=subtype,
@@ -172,7 +229,7 @@ class PluginFlavorRegistry:
             items=page_items,
         )
 
-    @property
+    @cached_property
     def _builtin_flavors(self) -> Sequence[Type["BasePluginFlavor"]]:
         """A list of all default in-built flavors.
 
@@ -186,7 +243,7 @@ class PluginFlavorRegistry:
         flavors = [PipelineRunActionFlavor]
         return flavors
 
-    @property
+    @cached_property
     def _integration_flavors(self) -> Sequence[Type["BasePluginFlavor"]]:
         """A list of all integration event flavors.
 
@@ -201,6 +258,23 @@ class PluginFlavorRegistry:
 
         return integrated_flavors
 
+    def refresh_integration_flavors(self) -> None:
+        """Re-collects the integration flavors and registers any new ones.
+
+        The integration flavors are only collected once per registry. This
+        needs to be called if integrations are registered after the registry
+        was created. The plugins of the newly registered flavors are created
+        right away, so new action handlers subscribe to the event hub.
+        """
+        self.__dict__.pop("_integration_flavors", None)
+        known_keys = set(self._entries)
+        for flavor in self._integration_flavors:
+            self.register_plugin_flavor(flavor_class=flavor)
+
+        for key, registry_entry in self._entries.items():
+            if key not in known_keys:
+                _initialize_plugin(registry_entry)
+
     def _get_registry_entry(
         self,
         _type: PluginType,
@@ -217,7 +291,7 @@ class PluginFlavorRegistry:
         Returns:
             The registry entry.
         """
-        return self.plugin_flavors[_type][subtype][flavor_name]
+        return self._entries[(_type, subtype, flavor_name)]
 
     def register_plugin_flavors(self) -> None:
         """Registers all flavors."""
@@ -234,33 +308,35 @@ class PluginFlavorRegistry:
         Args:
             flavor_class: The flavor to register
         """
-        try:
-            self._get_registry_entry(
-                _type=flavor_class.TYPE,
-                subtype=flavor_class.SUBTYPE,
-                flavor_name=flavor_class.FLAVOR,
-            )
-        except KeyError:
-            (
-                self.plugin_flavors.setdefault(flavor_class.TYPE, {})
-                .setdefault(flavor_class.SUBTYPE, {})
-                .setdefault(
-                    flavor_class.FLAVOR,
-                    RegistryEntry(flavor_class=flavor_class),
-                )
-            )
-            logger.debug(
-                f"Registered built in plugin {flavor_class.FLAVOR} for "
-                f"plugin type {flavor_class.TYPE} and "
-                f"subtype {flavor_class.SUBTYPE}: {flavor_class}"
-            )
-        else:
+        key = (flavor_class.TYPE, flavor_class.SUBTYPE, flavor_class.FLAVOR)
+        if key in self._entries:
             logger.debug(
                 f"Found existing flavor {flavor_class.FLAVOR} already "
                 f"registered for this type {flavor_class.TYPE} and subtype "
                 f"{flavor_class.SUBTYPE}. "
                 f"Skipping registration for {flavor_class}."
             )
+            return
+
+        # The flavor class is trusted internal input, so the entry is built
+        # without running the Pydantic validation.
+        self._entries[key] = RegistryEntry.model_construct(
+            flavor_class=flavor_class, plugin_instance=None
+        )
+        if flavor_class.TYPE not in self._by_type:
+            self._types_list.append(flavor_class.TYPE)
+        subtypes = self._by_type.setdefault(flavor_class.TYPE, [])
+        if flavor_class.SUBTYPE not in subtypes:
+            subtypes.append(flavor_class.SUBTYPE)
+        self._by_type_subtype.setdefault(
+            (flavor_class.TYPE, flavor_class.SUBTYPE), []
+        ).append(flavor_class)
+        self._snapshots.clear()
+        logger.debug(
+            f"Registered built in plugin {flavor_class.FLAVOR} for "
+            f"plugin type {flavor_class.TYPE} and "
+            f"subtype {flavor_class.SUBTYPE}: {flavor_class}"
+        )
 
     def get_flavor_class(
         self,
@@ -301,6 +377,9 @@ class PluginFlavorRegistry:
     ) -> "BasePlugin":
         """Get the plugin based on the flavor, type and subtype.
 
+        Plugins that were not created through `initialize_plugins` yet are
+        instantiated on first request.
+
         Args:
             name: The name of the plugin flavor.
             _type: The type of plugin.
@@ -312,7 +391,7 @@ class PluginFlavorRegistry:
         Raises:
             KeyError: If no plugin is found for the given flavor, type and
                 subtype.
-            RuntimeError: If the plugin was not initialized.
+            RuntimeError: If the plugin failed to initialize.
         """
         try:
             plugin_entry = self._get_registry_entry(
@@ -320,23 +399,49 @@ class PluginFlavorRegistry:
                 subtype=subtype,
                 flavor_name=name,
             )
-            if plugin_entry.plugin_instance is None:
-                raise RuntimeError(
-                    f"Plugin {plugin_entry.flavor_class} was not initialized."
-                )
-            return plugin_entry.plugin_instance
         except KeyError:
             raise KeyError(
                 f"No flavor found for flavor name {name} and type "
                 f"{_type} and subtype {subtype}."
             )
+        return plugin_entry.get_plugin_instance()
 
     def initialize_plugins(self) -> None:
-        """Initializes all registered plugins."""
-        for _, subtypes_dict in self.plugin_flavors.items():
-            for _, flavor_dict in subtypes_dict.items():
-                for _, registry_entry in flavor_dict.items():
-                    # TODO: Only initialize if the integration is active
-                    registry_entry.plugin_instance = (
-                        registry_entry.flavor_class.PLUGIN_CLASS()
-                    )
+        """Initializes all registered plugins.
+
+        This needs to happen before any events are processed: action handlers
+        subscribe to the event hub in their constructor, so an action handler
+        that was not created yet never receives events. Plugin constructors
+        may import integration modules or set up clients, so the plugins are
+        instantiated concurrently. A plugin that fails to initialize is logged
+        and skipped instead of aborting the whole batch.
+        """
+        # TODO: Only initialize if the integration is active
+        entries = list(self._entries.values())
+        if not entries:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(entries)),
+            thread_name_prefix="zenml-plugin-init",
+        ) as executor:
+            # Each entry stores its own instance, so the result does not
+            # depend on the order in which the plugins finish initializing.
+            list(executor.map(_initialize_plugin, entries))
+
+
+def _initialize_plugin(registry_entry: RegistryEntry) -> None:
+    """Instantiates the plugin of a registry entry.
+
+    Args:
+        registry_entry: The registry entry for which to create the plugin.
+    """
+    try:
+        registry_entry.get_plugin_instance()
+    except Exception:
+        logger.exception(
+            f"Failed to initialize plugin for flavor "
+            f"{registry_entry.flavor_class.FLAVOR} of type "
+            f"{registry_entry.flavor_class.TYPE} and subtype "
+            f"{registry_entry.flavor_class.SUBTYPE}."
+        )
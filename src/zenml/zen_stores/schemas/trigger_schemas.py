@@ -33,9 +33,6 @@ from zenml.models import (
     TriggerExecutionResponseResources,
     TriggerRequest,
     TriggerResponse,
-    TriggerResponseBody,
-    TriggerResponseMetadata,
-    TriggerResponseResources,
     TriggerUpdate,
 )
 from zenml.utils.json_utils import pydantic_encoder
@@ -230,7 +227,7 @@ class TriggerSchema(NamedSchema, table=True):
         """
         from zenml.models import TriggerExecutionResponse
 
-        body = TriggerResponseBody(
+        body = dict(
             user_id=self.user_id,
             project_id=self.project_id,
             created=self.created,
@@ -247,7 +244,7 @@ class TriggerSchema(NamedSchema, table=True):
         )
         metadata = None
         if include_metadata:
-            metadata = TriggerResponseMetadata(
+            metadata = dict(
                 event_filter=json.loads(
                     base64.b64decode(self.event_filter).decode()
                 ),
@@ -269,7 +266,7 @@ class TriggerSchema(NamedSchema, table=True):
                     include_metadata=False,
                 ),
             )
-            resources = TriggerResponseResources(
+            resources = dict(
                 user=self.user.to_model() if self.user else None,
                 action=self.action.to_model(),
                 event_source=self.event_source.to_model()
@@ -277,7 +274,7 @@ class TriggerSchema(NamedSchema, table=True):
                 else None,
                 executions=executions,
             )
-        return TriggerResponse(
+        return TriggerResponse.from_db(
             id=self.id,
             name=self.name,
             body=body,
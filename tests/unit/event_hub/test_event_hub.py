@@ -0,0 +1,52 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.actions.pipeline_run.pipeline_run_action import (
+    PipelineRunActionFlavor,
+)
+from zenml.event_hub.base_event_hub import BaseEventHub
+from zenml.event_hub.event_hub import event_hub
+from zenml.plugins.plugin_flavor_registry import PluginFlavorRegistry
+from zenml.zen_server import utils as zen_server_utils
+
+
+def test_publish_event_reaches_action_handler_of_fresh_registry(mocker):
+    """Test that events reach action handlers after the server startup."""
+    mocker.patch.object(zen_server_utils, "_plugin_flavor_registry", None)
+    mocker.patch.object(BaseEventHub, "action_handlers", {})
+    mocker.patch.object(PluginFlavorRegistry, "_integration_flavors", [])
+
+    zen_server_utils.initialize_plugins()
+
+    trigger = mocker.Mock(
+        action_flavor=PipelineRunActionFlavor.FLAVOR,
+        action_subtype=PipelineRunActionFlavor.SUBTYPE,
+    )
+    mocker.patch.object(
+        event_hub,
+        "get_matching_active_triggers_for_event",
+        return_value=[trigger],
+    )
+    trigger_action = mocker.patch.object(event_hub, "trigger_action")
+
+    event_hub.publish_event(event=mocker.Mock(), event_source=mocker.Mock())
+
+    trigger_action.assert_called_once()
+    assert trigger_action.call_args.kwargs["trigger"] is trigger
+    assert (
+        trigger_action.call_args.kwargs["action_callback"]
+        == event_hub.action_handlers[
+            (PipelineRunActionFlavor.FLAVOR, PipelineRunActionFlavor.SUBTYPE)
+        ]
+    )
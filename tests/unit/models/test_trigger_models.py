@@ -0,0 +1,124 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import uuid
+from typing import Any, Dict
+
+import pytest
+
+from zenml.exceptions import IllegalOperationError
+from zenml.models import (
+    TriggerResponse,
+    TriggerResponseBody,
+    TriggerResponseMetadata,
+)
+from zenml.utils.time_utils import utc_now
+
+
+def _get_trigger_values() -> Dict[str, Any]:
+    """Get the values of a trigger as they are read from the database."""
+    now = utc_now()
+    return {
+        "id": uuid.uuid4(),
+        "name": "trigger",
+        "body": {
+            "user_id": uuid.uuid4(),
+            "project_id": uuid.uuid4(),
+            "created": now,
+            "updated": now,
+            "action_flavor": "builtin",
+            "action_subtype": "pipeline_run",
+            "event_source_flavor": "github",
+            "event_source_subtype": "webhook",
+            "is_active": True,
+        },
+        "metadata": {
+            "description": "A trigger.",
+            "event_filter": {"repo": "zenml", "branches": ["main"]},
+            "schedule": None,
+        },
+    }
+
+
+def test_trigger_response_from_db_matches_validated_response():
+    """Test that `from_db` builds the same response as the constructor."""
+    values = _get_trigger_values()
+
+    constructed = TriggerResponse.from_db(
+        id=values["id"],
+        name=values["name"],
+        body=values["body"],
+        metadata=values["metadata"],
+    )
+    validated = TriggerResponse(
+        id=values["id"],
+        name=values["name"],
+        body=TriggerResponseBody(**values["body"]),
+        metadata=TriggerResponseMetadata(**values["metadata"]),
+    )
+
+    assert isinstance(constructed.get_body(), TriggerResponseBody)
+    assert isinstance(constructed.get_metadata(), TriggerResponseMetadata)
+    assert constructed.permission_denied is False
+    assert constructed.resources is None
+
+    for property_name in [
+        "id",
+        "name",
+        "permission_denied",
+        "user_id",
+        "project_id",
+        "action_flavor",
+        "action_subtype",
+        "event_source_flavor",
+        "event_source_subtype",
+        "is_active",
+        "description",
+        "event_filter",
+    ]:
+        assert getattr(constructed, property_name) == getattr(
+            validated, property_name
+        )
+
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_trigger_response_permission_denied_copy_hides_body():
+    """Test that a permission denied copy does not expose the original body."""
+    values = _get_trigger_values()
+    trigger = TriggerResponse.from_db(
+        id=values["id"],
+        name=values["name"],
+        body=values["body"],
+        metadata=values["metadata"],
+    )
+
+    # Access the body and metadata before copying, like the RBAC checks do,
+    # to make sure nothing read here leaks into the copy.
+    assert trigger.project_id == values["body"]["project_id"]
+    assert trigger.description == values["metadata"]["description"]
+
+    denied = trigger.model_copy(
+        update={
+            "body": None,
+            "metadata": None,
+            "resources": None,
+            "permission_denied": True,
+        }
+    )
+
+    with pytest.raises(IllegalOperationError):
+        denied.get_body()
+    with pytest.raises(IllegalOperationError):
+        denied.get_metadata()
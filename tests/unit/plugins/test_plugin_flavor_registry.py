@@ -0,0 +1,204 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import Any, Type
+
+import pytest
+
+from zenml.enums import PluginSubType, PluginType
+from zenml.models import BasePluginFlavorResponse
+from zenml.integrations.registry import integration_registry
+from zenml.plugins.base_plugin_flavor import BasePlugin, BasePluginFlavor
+from zenml.plugins.plugin_flavor_registry import PluginFlavorRegistry
+
+
+class StubPlugin(BasePlugin):
+    """Plugin without any behavior."""
+
+    config_class = None
+    flavor_class = None
+
+
+def _make_flavor(
+    name: str,
+    plugin_class: Type[BasePlugin] = StubPlugin,
+) -> Type[BasePluginFlavor]:
+    """Create a pipeline run action flavor with the given name."""
+
+    class StubFlavor(BasePluginFlavor):
+        TYPE = PluginType.ACTION
+        SUBTYPE = PluginSubType.PIPELINE_RUN
+        FLAVOR = name
+        PLUGIN_CLASS = plugin_class
+
+        @classmethod
+        def get_flavor_response_model(
+            cls, hydrate: bool
+        ) -> BasePluginFlavorResponse[Any, Any, Any]:
+            return BasePluginFlavorResponse(
+                name=cls.FLAVOR, type=cls.TYPE, subtype=cls.SUBTYPE
+            )
+
+    return StubFlavor
+
+
+@pytest.fixture
+def registry(mocker) -> PluginFlavorRegistry:
+    """Plugin flavor registry without any builtin or integration flavors."""
+    mocker.patch.object(PluginFlavorRegistry, "register_plugin_flavors")
+    return PluginFlavorRegistry()
+
+
+def test_flavor_responses_are_paginated(registry):
+    """Test that the flavor responses are split into pages."""
+    for name in ["a", "b", "c"]:
+        registry.register_plugin_flavor(_make_flavor(name))
+
+    page = registry.list_available_flavor_responses_for_type_and_subtype(
+        _type=PluginType.ACTION,
+        subtype=PluginSubType.PIPELINE_RUN,
+        page=2,
+        size=2,
+    )
+
+    assert page.total == 3
+    assert page.total_pages == 2
+    assert [item.name for item in page.items] == ["c"]
+
+
+def test_flavor_responses_reject_non_positive_page_size(registry):
+    """Test that listing flavor responses fails for a page size of zero."""
+    registry.register_plugin_flavor(_make_flavor("a"))
+
+    with pytest.raises(ValueError):
+        registry.list_available_flavor_responses_for_type_and_subtype(
+            _type=PluginType.ACTION,
+            subtype=PluginSubType.PIPELINE_RUN,
+            page=1,
+            size=0,
+        )
+
+
+def test_initialize_plugins_creates_all_plugin_instances(registry):
+    """Test that initializing the plugins creates an instance per entry."""
+    flavors = [_make_flavor(name) for name in ["a", "b", "c"]]
+    for flavor in flavors:
+        registry.register_plugin_flavor(flavor)
+
+    registry.initialize_plugins()
+
+    for flavor in flavors:
+        entry = registry._get_registry_entry(
+            _type=flavor.TYPE,
+            subtype=flavor.SUBTYPE,
+            flavor_name=flavor.FLAVOR,
+        )
+        assert isinstance(entry.plugin_instance, StubPlugin)
+
+
+def test_initialize_plugins_skips_failing_plugin(registry):
+    """Test that a failing plugin does not prevent initializing the others."""
+
+    class FailingPlugin(StubPlugin):
+        def __init__(self) -> None:
+            raise RuntimeError("Plugin failed to initialize.")
+
+    failing_flavor = _make_flavor("failing", plugin_class=FailingPlugin)
+    working_flavor = _make_flavor("working")
+    registry.register_plugin_flavor(failing_flavor)
+    registry.register_plugin_flavor(working_flavor)
+
+    registry.initialize_plugins()
+
+    failing_entry = registry._get_registry_entry(
+        _type=failing_flavor.TYPE,
+        subtype=failing_flavor.SUBTYPE,
+        flavor_name=failing_flavor.FLAVOR,
+    )
+    working_entry = registry._get_registry_entry(
+        _type=working_flavor.TYPE,
+        subtype=working_flavor.SUBTYPE,
+        flavor_name=working_flavor.FLAVOR,
+    )
+    assert failing_entry.plugin_instance is None
+    assert isinstance(working_entry.plugin_instance, StubPlugin)
+
+
+def test_get_plugin_fails_for_plugin_that_failed_to_initialize(registry):
+    """Test that a plugin failing to initialize is reported by `get_plugin`."""
+    constructor_calls = []
+
+    class FailingPlugin(StubPlugin):
+        def __init__(self) -> None:
+            constructor_calls.append(self)
+            raise ValueError("Plugin failed to initialize.")
+
+    failing_flavor = _make_flavor("failing", plugin_class=FailingPlugin)
+    registry.register_plugin_flavor(failing_flavor)
+    registry.initialize_plugins()
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="failing"):
+            registry.get_plugin(
+                _type=failing_flavor.TYPE,
+                subtype=failing_flavor.SUBTYPE,
+                name=failing_flavor.FLAVOR,
+            )
+
+    assert len(constructor_calls) == 1
+
+
+def test_registering_a_flavor_twice_is_skipped(registry):
+    """Test that registering the same flavor twice does not add duplicates."""
+    flavor = _make_flavor("a")
+
+    registry.register_plugin_flavor(flavor)
+    registry.register_plugin_flavor(flavor)
+    registry.register_plugin_flavor(_make_flavor("a"))
+
+    assert registry._types == (PluginType.ACTION,)
+    assert registry.list_subtypes_within_type(PluginType.ACTION) == (
+        PluginSubType.PIPELINE_RUN,
+    )
+    assert registry.list_available_flavors_for_type_and_subtype(
+        _type=PluginType.ACTION, subtype=PluginSubType.PIPELINE_RUN
+    ) == (flavor,)
+
+
+def test_refresh_integration_flavors_registers_and_initializes_new_flavors(
+    registry, mocker
+):
+    """Test that refreshing picks up flavors of integrations added later."""
+    mocker.patch.object(integration_registry, "_integrations", {})
+    assert registry._integration_flavors == []
+
+    flavor = _make_flavor("integration")
+    integration = mocker.Mock()
+    integration.plugin_flavors.return_value = [flavor]
+    mocker.patch.object(
+        integration_registry, "_integrations", {"stub": integration}
+    )
+
+    registry.refresh_integration_flavors()
+
+    entry = registry._get_registry_entry(
+        _type=flavor.TYPE,
+        subtype=flavor.SUBTYPE,
+        flavor_name=flavor.FLAVOR,
+    )
+    assert entry.flavor_class is flavor
+    assert registry.list_available_flavors_for_type_and_subtype(
+        _type=flavor.TYPE, subtype=flavor.SUBTYPE
+    ) == (flavor,)
+    assert isinstance(entry.plugin_instance, StubPlugin)
@@ -80,13 +80,17 @@ def _test_materializer(
     artifact_store_uri = Client().active_stack.artifact_store.path
     with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
         materializer = materializer_class(uri=artifact_uri)
-        existing_files = os.listdir(artifact_uri)
+        existing_files = set(os.listdir(artifact_uri))
 
         # Assert that materializer saves something to disk
         materializer.save(step_output)
         if assert_data_exists:
-            new_files = os.listdir(artifact_uri)
-            assert len(new_files) > len(existing_files)
+            created_files = [
+                file
+                for file in os.listdir(artifact_uri)
+                if file not in existing_files
+            ]
+            assert created_files
 
         # Assert that visualization extraction returns a dict
         visualizations = materializer.save_visualizations(step_output)